@@ -1,65 +1,322 @@
 from mcp.server.fastmcp import FastMCP
 import os
+import asyncio
+import codecs
 import json
-import base64
 import zipfile
-from io import BytesIO
-from urllib import request, parse
+from collections import OrderedDict
+from contextlib import closing
+from functools import lru_cache
+from itertools import islice
+from tempfile import SpooledTemporaryFile
 from typing import Optional
 
+import httpx
+import pybase64
+
+# Optional JSON accelerators: orjson for general encode/decode, simdjson for large bodies; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 app = FastMCP("github-remote-tools")
 
 # --------------------------- Utility: Minimal GitHub REST client ---------------------------
 GITHUB_API = "https://api.github.com"
+GITHUB_TIMEOUT = 30
 
+_TOKEN = os.environ.get("GITHUB_TOKEN")
+_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "mcp-fastmcp-demo",
+    # JSON listings compress 5-10x; httpx decodes gzip/deflate natively and br via the brotli extra
+    "Accept-Encoding": "gzip, deflate, br",
+}
+if _TOKEN:
+    _HEADERS["Authorization"] = f"Bearer {_TOKEN}"
 
-def _gh_headers() -> dict:
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "mcp-fastmcp-demo",
-    }
-    token = os.environ.get("GITHUB_TOKEN")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    return headers
+# One async HTTP/2 client for the whole process: concurrent requests are multiplexed over a single TLS connection
+_CLIENT = httpx.AsyncClient(http2=True, base_url=GITHUB_API, headers=_HEADERS, timeout=GITHUB_TIMEOUT)
 
 
-def _gh_get(path: str, params: Optional[dict] = None) -> dict:
-    url = f"{GITHUB_API}{path}"
-    if params:
-        url = f"{url}?{parse.urlencode(params)}"
-    req = request.Request(url, headers=_gh_headers())
-    with request.urlopen(req) as resp:
-        data = resp.read()
-    return json.loads(data.decode("utf-8"))
+@lru_cache(maxsize=256)
+def _split_repo(repo: str) -> tuple[str, str]:
+    owner, name = repo.split("/", 1)
+    return owner, name
+
+
+# Conditional-GET cache: url -> (etag, parsed body, raw body or None, size). 304 replies skip the transfer and do not
+# count against rate limit. Raw bytes are kept only for callers that ask for them; eviction is bounded by entry count
+# and by the total body size
+ETAG_CACHE_SIZE = 512
+ETAG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_ETAG_CACHE: "OrderedDict[str, tuple[str, dict, Optional[bytes], int]]" = OrderedDict()
+_etag_cache_bytes = 0
+
+# (repo, run_id, artifact_name) -> artifact_id, lets the zip download start before the artifact listing returns
+ARTIFACT_ID_CACHE_SIZE = 256
+_ARTIFACT_IDS: "OrderedDict[tuple[str, str, str], int]" = OrderedDict()
+
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# Bodies above this size go through simdjson; the Parser reuses its tape buffer, so results are materialised at once.
+# simdjson picks its SIMD kernel (AVX2, SSE4.2, NEON or scalar fallback) at runtime, so no CPU probing is needed here
+SIMDJSON_MIN_BYTES = 64 * 1024
+_SIMD = simdjson.Parser() if simdjson is not None else None
+
+
+def _loads(data: bytes):
+    if _SIMD is not None and len(data) > SIMDJSON_MIN_BYTES:
+        doc = _SIMD.parse(data)
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _lru_put(cache: OrderedDict, key, value, maxsize: int) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _etag_cache_put(url: str, entry: tuple) -> None:
+    global _etag_cache_bytes
+    previous = _ETAG_CACHE.pop(url, None)
+    if previous is not None:
+        _etag_cache_bytes -= previous[3]
+    _ETAG_CACHE[url] = entry
+    _etag_cache_bytes += entry[3]
+    while len(_ETAG_CACHE) > ETAG_CACHE_SIZE or _etag_cache_bytes > ETAG_CACHE_MAX_BYTES:
+        _, evicted = _ETAG_CACHE.popitem(last=False)
+        _etag_cache_bytes -= evicted[3]
+
+
+async def _gh_fetch(path: str, params: Optional[dict] = None, keep_raw: bool = False) -> tuple[dict, Optional[bytes]]:
+    # Returns the parsed body, plus the raw bytes it came from when keep_raw is set (tools that pass the JSON through)
+    req = _CLIENT.build_request("GET", path, params=params)
+    url = str(req.url)
+    cached = _ETAG_CACHE.get(url)
+    if cached is not None and keep_raw and cached[2] is None:
+        cached = None
+    if cached is not None:
+        req.headers["If-None-Match"] = cached[0]
+
+    resp = await _CLIENT.send(req)
+    if resp.status_code == 304 and cached is not None:
+        if url in _ETAG_CACHE:
+            _ETAG_CACHE.move_to_end(url)
+        return cached[1], cached[2]
+    resp.raise_for_status()
+
+    raw = resp.content
+    data = _loads(raw)
+    kept = raw if keep_raw else None
+    etag = resp.headers.get("ETag")
+    if etag:
+        _etag_cache_put(url, (etag, data, kept, len(raw) * (2 if keep_raw else 1)))
+    return data, kept
+
+
+async def _gh_get(path: str, params: Optional[dict] = None) -> dict:
+    data, _ = await _gh_fetch(path, params)
+    return data
+
+
+# Artifact zips stay in memory up to this size and spill to a temp file beyond it
+ZIP_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+ZIP_CHUNK_BYTES = 1024 * 1024
+
+
+class _ZipSpool(SpooledTemporaryFile):
+    # zipfile probes seekable()/readable(), which SpooledTemporaryFile only gained in Python 3.11
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+
+async def _gh_download_zip(owner: str, name: str, artifact_id) -> _ZipSpool:
+    path = f"/repos/{owner}/{name}/actions/artifacts/{artifact_id}/zip"
+    buf = _ZipSpool(max_size=ZIP_SPOOL_MAX_BYTES)
+    try:
+        async with _CLIENT.stream("GET", path, follow_redirects=True) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes(ZIP_CHUNK_BYTES):
+                buf.write(chunk)
+    except BaseException:
+        buf.close()
+        raise
+    buf.seek(0)
+    return buf
+
+
+# Single-file extraction reads the archive in place: the tail (end-of-central-directory + central directory) first,
+# then only the byte ranges of the wanted member. Blob storage URLs are pre-signed, so this client carries no auth
+ZIP_TAIL_BYTES = 64 * 1024
+ZIP_RANGE_BLOCK_BYTES = 1024 * 1024
+_RANGE_CLIENT = httpx.Client(http2=True, timeout=GITHUB_TIMEOUT)
+
+
+def _check_range(resp: httpx.Response, start: int) -> None:
+    # A 200 full body, or a range starting elsewhere, would be misplaced in the reader and surface as a CRC error
+    resp.raise_for_status()
+    if resp.status_code != 206 or not resp.headers.get("Content-Range", "").startswith(f"bytes {start}-"):
+        raise httpx.HTTPError(f"Range request at offset {start} was not honoured ({resp.status_code})")
+
+
+class _RangeReader:
+    # Minimal seekable file object for zipfile, backed by HTTP Range requests against a remote archive
+    def __init__(self, url: str, size: int, tail_start: int, tail: bytes):
+        self._url = url
+        self._size = size
+        self._pos = 0
+        self._tail = (tail_start, tail)
+        self._block = (0, b"")
+
+    def seekable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self._tail = self._block = (0, b"")
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        base = {0: 0, 1: self._pos, 2: self._size}[whence]
+        if base + offset < 0:
+            raise OSError("negative seek position")
+        self._pos = min(base + offset, self._size)
+        return self._pos
+
+    def read(self, n: int = -1) -> bytes:
+        end = self._size if n is None or n < 0 else min(self._pos + n, self._size)
+        if end <= self._pos:
+            return b""
+        for start, data in (self._tail, self._block):
+            if start <= self._pos and end <= start + len(data):
+                chunk = data[self._pos - start:end - start]
+                break
+        else:
+            fetch_end = min(self._size, max(end, self._pos + ZIP_RANGE_BLOCK_BYTES))
+            resp = _RANGE_CLIENT.get(self._url, headers={"Range": f"bytes={self._pos}-{fetch_end - 1}"})
+            _check_range(resp, self._pos)
+            self._block = (self._pos, resp.content)
+            chunk = resp.content[:end - self._pos]
+        self._pos += len(chunk)
+        return chunk
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    # Cancel a speculative task; its outcome is still retrieved once done, so an earlier failure is not logged as
+    # "Task exception was never retrieved"
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def _gh_artifact_url(owner: str, name: str, artifact_id) -> str:
+    # The zip endpoint answers with a redirect to a short-lived signed blob URL that supports Range requests
+    resp = await _CLIENT.get(f"/repos/{owner}/{name}/actions/artifacts/{artifact_id}/zip")
+    if resp.is_redirect:
+        return resp.headers["Location"]
+    resp.raise_for_status()
+    return str(resp.url)
+
+
+def _open_remote_zip(url: str):
+    # A one-byte probe gives the archive size via Content-Range; the tail is then fetched as an explicit start-end range
+    # (blob storage only documents `start-end`/`start-` forms). If Range is ignored, the full body is spooled instead
+    with _RANGE_CLIENT.stream("GET", url, headers={"Range": "bytes=0-0"}) as resp:
+        resp.raise_for_status()
+        if resp.status_code != 206:
+            buf = _ZipSpool(max_size=ZIP_SPOOL_MAX_BYTES)
+            try:
+                for chunk in resp.iter_bytes(ZIP_CHUNK_BYTES):
+                    buf.write(chunk)
+            except BaseException:
+                buf.close()
+                raise
+            buf.seek(0)
+            return buf
+        size = int(resp.headers["Content-Range"].rsplit("/", 1)[1])
+
+    tail_start = max(0, size - ZIP_TAIL_BYTES)
+    resp = _RANGE_CLIENT.get(url, headers={"Range": f"bytes={tail_start}-{size - 1}"})
+    _check_range(resp, tail_start)
+    return _RangeReader(url, size, tail_start, resp.content)
+
+
+def _read_zip_member(url: str, file_path: str) -> Optional[str]:
+    with closing(_open_remote_zip(url)) as source, zipfile.ZipFile(source) as zip_file:
+        for info in zip_file.infolist():
+            if file_path in info.filename or info.filename.endswith(file_path):
+                with zip_file.open(info) as f:
+                    return f.read().decode('utf-8', errors='replace')
+    return None
 
 
 def _decode_base64_text(b64: str, encoding: str = "utf-8") -> str:
-    return base64.b64decode(b64).decode(encoding, errors="replace")
+    return pybase64.b64decode_as_bytearray(b64, validate=False).decode(encoding, errors="replace")
+
+
+def _compile_projection(fields: tuple, rename: Optional[dict] = None):
+    # Generates a straight-line `def f(d): return {"out": d.get("src"), ...}` for a fixed response shape
+    rename = rename or {}
+    body = ", ".join(f"{rename.get(f, f)!r}: d.get({f!r})" for f in fields)
+    namespace = {}
+    exec(f"def projection(d):\n    return {{{body}}}\n", namespace)
+    return namespace["projection"]
+
+
+_PROJ_REPO_INFO = _compile_projection(
+    ("full_name", "description", "default_branch", "stargazers_count", "forks_count", "open_issues_count", "language"),
+    rename={"stargazers_count": "stars", "forks_count": "forks", "open_issues_count": "open_issues"},
+)
+_PROJ_CONTENT = _compile_projection(("type", "name", "path"))
+_PROJ_ITEM = _compile_projection(("number", "title", "state"))
+_PROJ_RUN = _compile_projection(
+    ("id", "run_number", "name", "status", "conclusion", "created_at", "updated_at"),
+    rename={"id": "run_id"},
+)
+_PROJ_LATEST_RUN = _compile_projection(
+    ("id", "run_number", "name", "status", "conclusion", "created_at", "head_branch", "head_sha"),
+    rename={"id": "run_id"},
+)
+_PROJ_ARTIFACT = _compile_projection(("id", "name", "size_in_bytes", "created_at", "expires_at"))
 
 
 # ----------------------------------- GitHub Repository tools --------------------------------
+
+
 @app.tool(description="Get repository info summary. repo format: 'owner/name'")
-def github_repo_info(repo: str) -> str:
-    owner, name = repo.split("/", 1)
-    info = _gh_get(f"/repos/{owner}/{name}")
-    summary = {
-        "full_name": info.get("full_name"),
-        "description": info.get("description"),
-        "default_branch": info.get("default_branch"),
-        "stars": info.get("stargazers_count"),
-        "forks": info.get("forks_count"),
-        "open_issues": info.get("open_issues_count"),
-        "language": info.get("language"),
-    }
-    return json.dumps(summary, ensure_ascii=False, indent=2)
+async def github_repo_info(repo: str) -> str:
+    owner, name = _split_repo(repo)
+    info = await _gh_get(f"/repos/{owner}/{name}")
+    return _dumps(_PROJ_REPO_INFO(info))
 
 
 @app.tool(description="Fetch README.md (decoded). repo format: 'owner/name'")
-def github_readme(repo: str, ref: Optional[str] = None) -> str:
-    owner, name = repo.split("/", 1)
+async def github_readme(repo: str, ref: Optional[str] = None) -> str:
+    owner, name = _split_repo(repo)
     params = {"ref": ref} if ref else None
-    data = _gh_get(f"/repos/{owner}/{name}/readme", params=params)
+    data = await _gh_get(f"/repos/{owner}/{name}/readme", params=params)
     content = data.get("content")
     if not content:
         return "(No README content)"
@@ -67,140 +324,151 @@ def github_readme(repo: str, ref: Optional[str] = None) -> str:
 
 
 @app.tool(description="List files at path in repo. repo: 'owner/name', path default repo root")
-def github_list_files(repo: str, path: str = "", ref: Optional[str] = None) -> str:
-    owner, name = repo.split("/", 1)
+async def github_list_files(repo: str, path: str = "", ref: Optional[str] = None) -> str:
+    owner, name = _split_repo(repo)
     api_path = f"/repos/{owner}/{name}/contents/{path}" if path else f"/repos/{owner}/{name}/contents"
     params = {"ref": ref} if ref else None
-    data = _gh_get(api_path, params=params)
+    data = await _gh_get(api_path, params=params)
     if isinstance(data, dict) and data.get("type") == "file":
-        return json.dumps({"type": "file", "name": data.get("name"), "path": data.get("path")}, indent=2)
-    items = []
-    for entry in data:
-        items.append({"type": entry.get("type"), "name": entry.get("name"), "path": entry.get("path")})
-    return json.dumps(items, ensure_ascii=False, indent=2)
+        return _dumps(_PROJ_CONTENT(data))
+    return _dumps([_PROJ_CONTENT(entry) for entry in data])
 
 
 @app.tool(description="Get a text file from repo (decoded). repo: 'owner/name', path: file path")
-def github_get_file(repo: str, path: str, ref: Optional[str] = None) -> str:
-    owner, name = repo.split("/", 1)
+async def github_get_file(repo: str, path: str, ref: Optional[str] = None) -> str:
+    owner, name = _split_repo(repo)
     params = {"ref": ref} if ref else None
-    data = _gh_get(f"/repos/{owner}/{name}/contents/{path}", params=params)
+    data, raw = await _gh_fetch(f"/repos/{owner}/{name}/contents/{path}", params=params, keep_raw=True)
     if data.get("encoding") == "base64" and data.get("content"):
         return _decode_base64_text(data["content"])
-    return json.dumps(data, ensure_ascii=False, indent=2)
+    return raw.decode("utf-8", errors="replace")
 
 
-@app.tool(description="List issues. repo: 'owner/name', state: open|closed|all")
-def github_list_issues(repo: str, state: str = "open") -> str:
-    owner, name = repo.split("/", 1)
-    issues = _gh_get(f"/repos/{owner}/{name}/issues", params={"state": state, "per_page": 50})
+# GitHub caps per_page at 100 for list endpoints
+ISSUES_PAGE_SIZE = 100
+
+
+@app.tool(description="List issues. repo: 'owner/name', state: open|closed|all, limit: max issues to return (default 50)")
+async def github_list_issues(repo: str, state: str = "open", limit: int = 50) -> str:
+    owner, name = _split_repo(repo)
+    # /issues mixes in PRs, so ask for at least 50 per page and keep paging until `limit` real issues are found
+    limit = max(limit, 0)
+    per_page = min(max(limit, 50), ISSUES_PAGE_SIZE)
     out = []
-    for i in issues:
-        if "pull_request" in i:
-            continue
-        out.append({"number": i.get("number"), "title": i.get("title"), "state": i.get("state")})
-    return json.dumps(out, ensure_ascii=False, indent=2)
+    page = 1
+    while len(out) < limit:
+        issues = await _gh_get(f"/repos/{owner}/{name}/issues", params={"state": state, "per_page": per_page, "page": page})
+        out.extend(islice((_PROJ_ITEM(i) for i in issues if "pull_request" not in i), limit - len(out)))
+        if len(issues) < per_page:
+            break
+        page += 1
+    return _dumps(out)
 
 
 @app.tool(description="List pull requests. repo: 'owner/name', state: open|closed|all")
-def github_list_prs(repo: str, state: str = "open") -> str:
-    owner, name = repo.split("/", 1)
-    prs = _gh_get(f"/repos/{owner}/{name}/pulls", params={"state": state, "per_page": 50})
-    out = []
-    for p in prs:
-        out.append({"number": p.get("number"), "title": p.get("title"), "state": p.get("state")})
-    return json.dumps(out, ensure_ascii=False, indent=2)
+async def github_list_prs(repo: str, state: str = "open") -> str:
+    owner, name = _split_repo(repo)
+    prs = await _gh_get(f"/repos/{owner}/{name}/pulls", params={"state": state, "per_page": 50})
+    out = [_PROJ_ITEM(p) for p in prs]
+    return _dumps(out)
 
 
 # ----------------------------------- GitHub Actions tools --------------------------------
-@app.tool(description="List workflow runs. repo: 'owner/name', limit: max runs to return (default 10)")
-def github_list_runs(repo: str, limit: int = 10) -> str:
-    owner, name = repo.split("/", 1)
-    runs = _gh_get(
-        f"/repos/{owner}/{name}/actions/runs",
-        params={"per_page": limit}
-    )
-    out = []
-    for run in runs.get("workflow_runs", []):
-        out.append({
-            "run_id": run.get("id"),
-            "run_number": run.get("run_number"),
-            "name": run.get("name"),
-            "status": run.get("status"),
-            "conclusion": run.get("conclusion"),
-            "created_at": run.get("created_at"),
-            "updated_at": run.get("updated_at"),
-        })
-    return json.dumps(out, ensure_ascii=False, indent=2)
+RUNS_PAGE_SIZE = 100
+# The runs listing stops at 1000 results; page requests in flight are capped to stay clear of secondary rate limits
+RUNS_MAX_RESULTS = 1000
+RUNS_MAX_CONCURRENT_PAGES = 4
+
+
+@app.tool(description="List workflow runs. repo: 'owner/name', limit: max runs to return (default 10, max 1000)")
+async def github_list_runs(repo: str, limit: int = 10) -> str:
+    owner, name = _split_repo(repo)
+    # GitHub caps per_page at 100, so larger limits are fetched as concurrent page requests
+    limit = min(limit, RUNS_MAX_RESULTS)
+    per_page = max(1, min(limit, RUNS_PAGE_SIZE))
+    semaphore = asyncio.Semaphore(RUNS_MAX_CONCURRENT_PAGES)
+
+    async def fetch_page(page: int) -> dict:
+        async with semaphore:
+            return await _gh_get(f"/repos/{owner}/{name}/actions/runs", params={"per_page": per_page, "page": page})
+
+    pages = await asyncio.gather(*[fetch_page(page) for page in range(1, -(-limit // per_page) + 1)])
+    workflow_runs = [run for runs in pages for run in runs.get("workflow_runs", [])][:limit]
+    return _dumps([_PROJ_RUN(run) for run in workflow_runs])
 
 
 @app.tool(description="Get latest workflow run details. repo: 'owner/name'")
-def github_get_latest_run(repo: str) -> str:
-    owner, name = repo.split("/", 1)
-    runs = _gh_get(f"/repos/{owner}/{name}/actions/runs", params={"per_page": 1})
+async def github_get_latest_run(repo: str) -> str:
+    owner, name = _split_repo(repo)
+    runs = await _gh_get(f"/repos/{owner}/{name}/actions/runs", params={"per_page": 1})
     if not runs.get("workflow_runs"):
-        return json.dumps({"error": "No runs found"})
-    run = runs["workflow_runs"][0]
-    return json.dumps({
-        "run_id": run.get("id"),
-        "run_number": run.get("run_number"),
-        "name": run.get("name"),
-        "status": run.get("status"),
-        "conclusion": run.get("conclusion"),
-        "created_at": run.get("created_at"),
-        "head_branch": run.get("head_branch"),
-        "head_sha": run.get("head_sha"),
-    }, ensure_ascii=False, indent=2)
+        return _dumps({"error": "No runs found"})
+    return _dumps(_PROJ_LATEST_RUN(runs["workflow_runs"][0]))
 
 
 @app.tool(description="List artifacts from a workflow run. repo: 'owner/name', run_id: workflow run ID")
-def github_list_artifacts(repo: str, run_id: str) -> str:
-    owner, name = repo.split("/", 1)
-    artifacts = _gh_get(f"/repos/{owner}/{name}/actions/runs/{run_id}/artifacts")
-    out = []
-    for artifact in artifacts.get("artifacts", []):
-        out.append({
-            "id": artifact.get("id"),
-            "name": artifact.get("name"),
-            "size_in_bytes": artifact.get("size_in_bytes"),
-            "created_at": artifact.get("created_at"),
-            "expires_at": artifact.get("expires_at"),
-        })
-    return json.dumps(out, ensure_ascii=False, indent=2)
+async def github_list_artifacts(repo: str, run_id: str) -> str:
+    owner, name = _split_repo(repo)
+    artifacts = await _gh_get(f"/repos/{owner}/{name}/actions/runs/{run_id}/artifacts")
+    return _dumps([_PROJ_ARTIFACT(artifact) for artifact in artifacts.get("artifacts", [])])
 
 
-@app.tool(description="Download artifact contents as ZIP. repo: 'owner/name', artifact_id: artifact ID")
-def github_download_artifact(repo: str, artifact_id: str) -> str:
-    owner, name = repo.split("/", 1)
-    url = f"{GITHUB_API}/repos/{owner}/{name}/actions/artifacts/{artifact_id}/zip"
-    req = request.Request(url, headers=_gh_headers())
+BINARY_SNIFF_BYTES = 512
+
 
+def _looks_binary(head: bytes) -> bool:
+    # file(1)-style sniff: NUL bytes or a prefix that is not valid UTF-8 (a multibyte char cut at the end is fine)
+    if b"\x00" in head:
+        return True
     try:
-        with request.urlopen(req) as resp:
-            zip_data = resp.read()
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return True
+    return False
 
-        # Extract and list contents
-        zip_file = zipfile.ZipFile(BytesIO(zip_data))
-        files = {}
+
+def _dump_zip_texts(buf) -> str:
+    # Decompression, decoding and serialisation are CPU-bound, so this runs in a worker thread, off the event loop
+    files = {}
+    with zipfile.ZipFile(buf) as zip_file:
         for filename in zip_file.namelist():
-            try:
-                content = zip_file.read(filename).decode('utf-8', errors='replace')
-                files[filename] = content
-            except:
-                files[filename] = f"[Binary file: {filename}]"
+            with zip_file.open(filename) as f:
+                head = f.read(BINARY_SNIFF_BYTES)
+                if _looks_binary(head):
+                    files[filename] = f"[Binary file: {filename}]"
+                    continue
+                files[filename] = (head + f.read()).decode('utf-8', errors='replace')
+    return _dumps(files)
 
-        return json.dumps(files, ensure_ascii=False, indent=2)
+
+@app.tool(description="Download artifact contents as ZIP. repo: 'owner/name', artifact_id: artifact ID")
+async def github_download_artifact(repo: str, artifact_id: str) -> str:
+    owner, name = _split_repo(repo)
+
+    try:
+        # Extract and list contents
+        with await _gh_download_zip(owner, name, artifact_id) as buf:
+            return await asyncio.to_thread(_dump_zip_texts, buf)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @app.tool(
     description="Get artifact file content. repo: 'owner/name', run_id: run ID, artifact_name: artifact name, file_path: path in artifact")
-def github_get_artifact_file(repo: str, run_id: str, artifact_name: str, file_path: str) -> str:
-    owner, name = repo.split("/", 1)
+async def github_get_artifact_file(repo: str, run_id: str, artifact_name: str, file_path: str) -> str:
+    owner, name = _split_repo(repo)
 
-    # List artifacts for this run
-    artifacts = _gh_get(f"/repos/{owner}/{name}/actions/runs/{run_id}/artifacts")
+    # List artifacts for this run; on a known name->id the signed archive URL is resolved alongside the listing
+    cache_key = (repo, str(run_id), artifact_name)
+    cached_id = _ARTIFACT_IDS.get(cache_key)
+    url_task = asyncio.create_task(_gh_artifact_url(owner, name, cached_id)) if cached_id else None
+
+    try:
+        artifacts = await _gh_get(f"/repos/{owner}/{name}/actions/runs/{run_id}/artifacts")
+    except BaseException:
+        if url_task:
+            _discard_task(url_task)
+        raise
     artifact_id = None
     for artifact in artifacts.get("artifacts", []):
         if artifact.get("name") == artifact_name:
@@ -208,27 +476,25 @@ def github_get_artifact_file(repo: str, run_id: str, artifact_name: str, file_pa
             break
 
     if not artifact_id:
-        return json.dumps({"error": f"Artifact '{artifact_name}' not found"})
+        if url_task:
+            _discard_task(url_task)
+        return _dumps({"error": f"Artifact '{artifact_name}' not found"})
 
-    # Download and extract
-    url = f"{GITHUB_API}/repos/{owner}/{name}/actions/artifacts/{artifact_id}/zip"
-    req = request.Request(url, headers=_gh_headers())
+    _lru_put(_ARTIFACT_IDS, cache_key, artifact_id, ARTIFACT_ID_CACHE_SIZE)
+    if artifact_id != cached_id:
+        if url_task:
+            _discard_task(url_task)
+        url_task = asyncio.create_task(_gh_artifact_url(owner, name, artifact_id))
 
+    # Fetch the central directory, then only the byte range of the matching member
     try:
-        with request.urlopen(req) as resp:
-            zip_data = resp.read()
-
-        zip_file = zipfile.ZipFile(BytesIO(zip_data))
-
-        # Find the file in the artifact
-        for filename in zip_file.namelist():
-            if file_path in filename or filename.endswith(file_path):
-                content = zip_file.read(filename).decode('utf-8', errors='replace')
-                return content
+        content = await asyncio.to_thread(_read_zip_member, await url_task, file_path)
+        if content is not None:
+            return content
 
-        return json.dumps({"error": f"File '{file_path}' not found in artifact"})
+        return _dumps({"error": f"File '{file_path}' not found in artifact"})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 if __name__ == "__main__":
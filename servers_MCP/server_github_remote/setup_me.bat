@@ -1 +1 @@
-uv sync
\ No newline at end of file
+uv sync --extra fast-json
\ No newline at end of file
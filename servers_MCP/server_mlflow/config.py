@@ -5,6 +5,10 @@ class cnfg_experiment(config_base.cnfg_base):
     folder_out = None
     host_mlflow = 'http://127.0.0.1'
     port_mlflow = 5000
+    mlflow_pool_size = 8
+    health_ttl_s = 3.0
+    health_base_interval = 5.0
+    health_max_interval = 60.0
     # ----------------------------------------------------------------------------------------------------------------------
     experiemnt_name = 'test_experiment'
     param_A = 1
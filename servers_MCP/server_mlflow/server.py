@@ -6,13 +6,22 @@ Includes get_last_run_id for convenient workflow
 """
 
 from mcp.server.fastmcp import FastMCP
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
 import tools_MLflower
 import config as config_module
 from typing import Optional, List, Dict, Any
-import json
+import os
 from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
 import logging
 import traceback
+import time
+import random
+import re
 import sys
 import io
 
@@ -39,15 +48,23 @@ logger.info("=" * 80)
 logger.info("Starting MLflow MCP Server")
 logger.info("=" * 80)
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    # Blocking MLflow calls run via asyncio.to_thread; cap the default executor they share
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=cfg.mlflow_pool_size))
+    yield
+
+
 # Initialize MCP server
-mcp = FastMCP("MLflow Server")
+mcp = FastMCP("MLflow Server", lifespan=_lifespan)
 
 # Load configuration
 try:
     cfg = config_module.cnfg_experiment()
-    logger.info(f"Configuration loaded: host={cfg.host_mlflow}, port={cfg.port_mlflow}")
+    logger.info("Configuration loaded: host=%s, port=%s", cfg.host_mlflow, cfg.port_mlflow)
 except Exception as e:
-    logger.error(f"Failed to load configuration: {e}", exc_info=True)
+    logger.error("Failed to load configuration: %s", e, exc_info=True)
     exit(1)
 
 # Initialize MLflow wrapper
@@ -62,9 +79,9 @@ try:
         ppk_key_path=getattr(cfg, 'ppk_key_path', None),
         password_ssh=getattr(cfg, 'password_ssh', None),
     )
-    logger.info(f"MLflow client initialized: is_available={mlflow_client.is_available}")
+    logger.info("MLflow client initialized: is_available=%s", mlflow_client.is_available)
 except Exception as e:
-    logger.error(f"Failed to initialize MLflow client: {e}", exc_info=True)
+    logger.error("Failed to initialize MLflow client: %s", e, exc_info=True)
     exit(1)
 
 # Check if client is available
@@ -74,6 +91,46 @@ if not mlflow_client.is_available:
 
 logger.info("MLflow client is available and ready")
 
+# Short-lived cache of Run objects: params/metrics/artifact lookups on the same run share one MLflow round-trip.
+# Cleared by set_tracking_*, since cached runs belong to the previous store
+_run_cache = TTLCache(maxsize=256, ttl=30)
+
+# MLflow run IDs are 32 lowercase hex chars; anything else is rejected before it reaches the tracking store
+_RUN_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+# MLFlower.save_experiment/update_run/get_uris drive MLflow's fluent API (start_run/end_run/log_*), whose active-run
+# stack is process-global in mlflow < 2.17: calls from concurrent worker threads would end or log into each other's runs
+_fluent_lock = asyncio.Lock()
+
+
+async def _cached_run(run_id: str):
+    run = _run_cache.get(run_id)
+    if run is None:
+        run = await asyncio.to_thread(mlflow_client.get_run, run_id)
+        _run_cache[run_id] = run
+    return run
+
+
+def _tool_errorwrap(*echo: str):
+    """Turn an exception raised by a tool into a status=error payload that echoes the named arguments"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        async def wrapper(**kwargs):
+            try:
+                return await fn(**kwargs)
+            except Exception as e:
+                debug = logger.isEnabledFor(logging.DEBUG)
+                logger.error("✗ %s failed: %s", fn.__name__, e, exc_info=debug)
+                return {
+                    "status": "error",
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    **{name: kwargs.get(name) for name in echo},
+                    "traceback": traceback.format_exc() if debug else None
+                }
+        return wrapper
+    return decorate
+
 
 # ============================================================================
 # CORE: SAVE EXPERIMENT (Main operation)
@@ -110,34 +167,38 @@ async def save_experiment(
     metrics = metrics or {}
     artifacts = artifacts or []
 
-    # Debug info to return
-    debug_info = {
-        "experiment_name": experiment_name,
-        "params_received": params,
-        "metrics_received": metrics,
-        "artifacts_received": artifacts,
-        "param_types": {k: type(v).__name__ for k, v in params.items()},
-        "metric_types": {k: type(v).__name__ for k, v in metrics.items()}
-    }
+    # Debug info to return (only built when DEBUG logging is enabled)
+    debug_info = None
+    if logger.isEnabledFor(logging.DEBUG):
+        debug_info = {
+            "experiment_name": experiment_name,
+            "params_received": params,
+            "metrics_received": metrics,
+            "artifacts_received": artifacts,
+            "param_types": {k: type(v).__name__ for k, v in params.items()},
+            "metric_types": {k: type(v).__name__ for k, v in metrics.items()}
+        }
 
     logger.info("=" * 80)
     logger.info("save_experiment called")
-    logger.info(f"  experiment_name: {experiment_name}")
-    logger.info(f"  params: {params}")
-    logger.info(f"  metrics: {metrics}")
-    logger.info(f"  artifacts: {artifacts}")
-    logger.debug(f"  debug_info: {debug_info}")
+    logger.info("  experiment_name: %s", experiment_name)
+    logger.info("  params: %s", params)
+    logger.info("  metrics: %s", metrics)
+    logger.info("  artifacts: %s", artifacts)
+    logger.debug("  debug_info: %s", debug_info)
 
     try:
         logger.info("Calling mlflow_client.save_experiment...")
-        run_id = mlflow_client.save_experiment(
-            experiment_name=experiment_name,
-            params=params,
-            metrics=metrics,
-            artifacts=artifacts
-        )
+        async with _fluent_lock:
+            run_id = await asyncio.to_thread(
+                mlflow_client.save_experiment,
+                experiment_name=experiment_name,
+                params=params,
+                metrics=metrics,
+                artifacts=artifacts
+            )
 
-        logger.info(f"✓ save_experiment succeeded with run_id: {run_id}")
+        logger.info("✓ save_experiment succeeded with run_id: %s", run_id)
 
         return {
             "status": "success",
@@ -151,17 +212,15 @@ async def save_experiment(
         }
 
     except Exception as e:
-        logger.error(f"✗ save_experiment failed: {str(e)}", exc_info=True)
-        error_msg = {
+        # the traceback is formatted by the log handler, and only with DEBUG on; the response carries only the message
+        logger.error("✗ save_experiment failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return {
             "status": "error",
             "error": str(e),
             "error_type": type(e).__name__,
             "experiment_name": experiment_name,
-            "traceback": traceback.format_exc(),
             "debug": debug_info
         }
-        logger.error(f"Error response: {json.dumps(error_msg, indent=2)}")
-        return error_msg
 
 
 # ============================================================================
@@ -169,6 +228,7 @@ async def save_experiment(
 # ============================================================================
 
 @mcp.tool()
+@_tool_errorwrap()
 async def get_experiment_id(
         experiment_name: str,
         create: bool = True
@@ -183,40 +243,32 @@ async def get_experiment_id(
     Returns:
         experiment_id or error
     """
-    logger.info(f"get_experiment_id called: experiment_name={experiment_name}, create={create}")
+    logger.info("get_experiment_id called: experiment_name=%s, create=%s", experiment_name, create)
 
-    try:
-        exp_id = mlflow_client.get_experiment_id(
-            experiment_name=experiment_name,
-            create=create
-        )
-
-        if exp_id is None:
-            logger.warning(f"Experiment '{experiment_name}' not found and create=False")
-            return {
-                "status": "not_found",
-                "experiment_name": experiment_name,
-                "message": f"Experiment '{experiment_name}' not found and create=False"
-            }
+    exp_id = await asyncio.to_thread(
+        mlflow_client.get_experiment_id,
+        experiment_name=experiment_name,
+        create=create
+    )
 
-        logger.info(f"✓ Got experiment_id: {exp_id}")
+    if exp_id is None:
+        logger.warning("Experiment '%s' not found and create=False", experiment_name)
         return {
-            "status": "success",
-            "experiment_id": exp_id,
-            "experiment_name": experiment_name
+            "status": "not_found",
+            "experiment_name": experiment_name,
+            "message": f"Experiment '{experiment_name}' not found and create=False"
         }
 
-    except Exception as e:
-        logger.error(f"✗ get_experiment_id failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc()
-        }
+    logger.info("✓ Got experiment_id: %s", exp_id)
+    return {
+        "status": "success",
+        "experiment_id": exp_id,
+        "experiment_name": experiment_name
+    }
 
 
 @mcp.tool()
+@_tool_errorwrap("experiment_name")
 async def get_last_run_id(experiment_name: str) -> Dict[str, Any]:
     """
     Get the last (most recent) run ID from an experiment
@@ -231,42 +283,32 @@ async def get_last_run_id(experiment_name: str) -> Dict[str, Any]:
         get_last_run_id(experiment_name="yolo-training")
         # Returns: {"status": "success", "run_id": "abc123def456", ...}
     """
-    logger.info(f"get_last_run_id called: experiment_name={experiment_name}")
-
-    try:
-        run_id = mlflow_client.get_last_run_id(experiment_name)
+    logger.info("get_last_run_id called: experiment_name=%s", experiment_name)
 
-        if run_id is None:
-            logger.warning(f"No runs found for experiment '{experiment_name}'")
-            return {
-                "status": "not_found",
-                "experiment_name": experiment_name,
-                "message": f"No runs found for experiment '{experiment_name}'"
-            }
+    run_id = await asyncio.to_thread(mlflow_client.get_last_run_id, experiment_name)
 
-        logger.info(f"✓ Retrieved last run_id: {run_id}")
+    if run_id is None:
+        logger.warning("No runs found for experiment '%s'", experiment_name)
         return {
-            "status": "success",
-            "run_id": run_id,
-            "experiment_name": experiment_name
-        }
-
-    except Exception as e:
-        logger.error(f"✗ get_last_run_id failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
+            "status": "not_found",
             "experiment_name": experiment_name,
-            "traceback": traceback.format_exc()
+            "message": f"No runs found for experiment '{experiment_name}'"
         }
 
+    logger.info("✓ Retrieved last run_id: %s", run_id)
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "experiment_name": experiment_name
+    }
+
 
 # ============================================================================
 # READ: GET RUN DETAILS
 # ============================================================================
 
 @mcp.tool()
+@_tool_errorwrap("run_id")
 async def get_run_params(run_id: str) -> Dict[str, Any]:
     """
     Get parameters from a specific run
@@ -277,29 +319,20 @@ async def get_run_params(run_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary of parameters
     """
-    logger.info(f"get_run_params called: run_id={run_id}")
-
-    try:
-        params = mlflow_client.get_run_params(run_id)
-        logger.info(f"✓ Retrieved {len(params)} parameters")
-        return {
-            "status": "success",
-            "run_id": run_id,
-            "params": params,
-            "count": len(params)
-        }
-    except Exception as e:
-        logger.error(f"✗ get_run_params failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": run_id,
-            "traceback": traceback.format_exc()
-        }
+    logger.info("get_run_params called: run_id=%s", run_id)
+
+    params = (await _cached_run(run_id)).data.params
+    logger.info("✓ Retrieved %s parameters", len(params))
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "params": params,
+        "count": len(params)
+    }
 
 
 @mcp.tool()
+@_tool_errorwrap("run_id")
 async def get_run_metrics(run_id: str) -> Dict[str, Any]:
     """
     Get metrics from a specific run
@@ -310,29 +343,20 @@ async def get_run_metrics(run_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary of metrics
     """
-    logger.info(f"get_run_metrics called: run_id={run_id}")
-
-    try:
-        metrics = mlflow_client.get_run_metrics(run_id)
-        logger.info(f"✓ Retrieved {len(metrics)} metrics")
-        return {
-            "status": "success",
-            "run_id": run_id,
-            "metrics": metrics,
-            "count": len(metrics)
-        }
-    except Exception as e:
-        logger.error(f"✗ get_run_metrics failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": run_id,
-            "traceback": traceback.format_exc()
-        }
+    logger.info("get_run_metrics called: run_id=%s", run_id)
+
+    metrics = (await _cached_run(run_id)).data.metrics
+    logger.info("✓ Retrieved %s metrics", len(metrics))
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "metrics": metrics,
+        "count": len(metrics)
+    }
 
 
 @mcp.tool()
+@_tool_errorwrap("run_id")
 async def get_run_artifact_filenames(run_id: str) -> Dict[str, Any]:
     """
     Get list of artifact filenames for a run
@@ -343,26 +367,43 @@ async def get_run_artifact_filenames(run_id: str) -> Dict[str, Any]:
     Returns:
         List of artifact URIs
     """
-    logger.info(f"get_run_artifact_filenames called: run_id={run_id}")
+    logger.info("get_run_artifact_filenames called: run_id=%s", run_id)
+
+    run = await _cached_run(run_id)
+    filenames = await asyncio.to_thread(mlflow_client.get_run_artifact_filenames, run_id, run.info.artifact_uri)
+    logger.info("✓ Retrieved %s artifact filenames", len(filenames))
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "artifacts": filenames,
+        "count": len(filenames)
+    }
 
-    try:
-        filenames = mlflow_client.get_run_artifact_filenames(run_id)
-        logger.info(f"✓ Retrieved {len(filenames)} artifact filenames")
-        return {
-            "status": "success",
-            "run_id": run_id,
-            "artifacts": filenames,
-            "count": len(filenames)
-        }
-    except Exception as e:
-        logger.error(f"✗ get_run_artifact_filenames failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": run_id,
-            "traceback": traceback.format_exc()
-        }
+
+@mcp.tool()
+@_tool_errorwrap("run_id")
+async def get_run(run_id: str) -> Dict[str, Any]:
+    """
+    Get parameters, metrics and artifact filenames of a run in one call
+
+    Args:
+        run_id: The run ID
+
+    Returns:
+        Dictionary with params, metrics and artifacts
+    """
+    logger.info("get_run called: run_id=%s", run_id)
+
+    run = await _cached_run(run_id)
+    filenames = await asyncio.to_thread(mlflow_client.get_run_artifact_filenames, run_id, run.info.artifact_uri)
+    logger.info("✓ Retrieved run %s", run_id)
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "params": run.data.params,
+        "metrics": run.data.metrics,
+        "artifacts": filenames
+    }
 
 
 # ============================================================================
@@ -370,6 +411,7 @@ async def get_run_artifact_filenames(run_id: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_tool_errorwrap("run_id")
 async def update_run(
         run_id: str,
         metrics: Optional[Dict[str, float]] = None,
@@ -396,33 +438,73 @@ async def update_run(
     metrics = metrics or {}
     artifacts = artifacts or []
 
-    logger.info(f"update_run called: run_id={run_id}, metrics={metrics}, artifacts={artifacts}")
+    logger.info("update_run called: run_id=%s, metrics=%s, artifacts=%s", run_id, metrics, artifacts)
 
-    try:
-        mlflow_client.update_run(
+    async with _fluent_lock:
+        await asyncio.to_thread(
+            mlflow_client.update_run,
             run_id=run_id,
             metrics=metrics,
             artifacts=artifacts
         )
 
-        logger.info(f"✓ update_run succeeded for run_id: {run_id}")
-        return {
-            "status": "success",
-            "run_id": run_id,
-            "metrics_updated": len(metrics),
-            "artifacts_added": len(artifacts),
-            "message": f"Run {run_id} updated successfully"
-        }
+    _run_cache.pop(run_id, None)
+    logger.info("✓ update_run succeeded for run_id: %s", run_id)
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "metrics_updated": len(metrics),
+        "artifacts_added": len(artifacts),
+        "message": f"Run {run_id} updated successfully"
+    }
 
-    except Exception as e:
-        logger.error(f"✗ update_run failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": run_id,
-            "traceback": traceback.format_exc()
-        }
+
+@mcp.tool()
+@_tool_errorwrap("run_id")
+async def log_batch(
+        run_id: str,
+        metrics: Optional[Dict[str, float]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, str]] = None,
+        step: int = 0
+) -> Dict[str, Any]:
+    """
+    Log many metrics, params and tags to an existing run in as few requests as possible
+
+    Args:
+        run_id: The run ID to log to
+        metrics: Dictionary of metrics
+        params: Dictionary of parameters
+        tags: Dictionary of tags
+        step: Step recorded with every metric
+
+    Returns:
+        Status and number of entries logged
+
+    Example:
+        log_batch(
+            run_id="abc123",
+            metrics={"loss": 0.05, "accuracy": 0.95},
+            params={"lr": 0.001},
+            tags={"stage": "finetune"}
+        )
+    """
+    metrics = metrics or {}
+    params = params or {}
+    tags = tags or {}
+
+    logger.info("log_batch called: run_id=%s, metrics=%s, params=%s, tags=%s", run_id, len(metrics), len(params), len(tags))
+
+    await asyncio.to_thread(mlflow_client.log_batch, run_id, metrics, params, tags, step)
+    _run_cache.pop(run_id, None)
+    logger.info("✓ log_batch succeeded for run_id: %s", run_id)
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "metrics_logged": len(metrics),
+        "params_logged": len(params),
+        "tags_logged": len(tags)
+    }
 
 
 # ============================================================================
@@ -430,6 +512,7 @@ async def update_run(
 # ============================================================================
 
 @mcp.tool()
+@_tool_errorwrap("run_id", "local_dir")
 async def download_artifacts(
         run_id: str,
         local_dir: str
@@ -444,38 +527,29 @@ async def download_artifacts(
     Returns:
         Status and downloaded files
     """
-    logger.info(f"download_artifacts called: run_id={run_id}, local_dir={local_dir}")
-
-    try:
-        # Create directory if doesn't exist
-        Path(local_dir).mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Created directory: {local_dir}")
+    logger.info("download_artifacts called: run_id=%s, local_dir=%s", run_id, local_dir)
 
-        mlflow_client.download_artifacts(local_dir, run_id)
+    # Create directory if doesn't exist
+    Path(local_dir).mkdir(parents=True, exist_ok=True)
+    logger.debug("Created directory: %s", local_dir)
 
-        # List downloaded files
-        downloaded = list(Path(local_dir).rglob("*"))
-        downloaded_files = [str(f.relative_to(local_dir)) for f in downloaded if f.is_file()]
+    await asyncio.to_thread(mlflow_client.download_artifacts, local_dir, run_id)
 
-        logger.info(f"✓ Downloaded {len(downloaded_files)} artifacts")
-        return {
-            "status": "success",
-            "run_id": run_id,
-            "local_dir": str(local_dir),
-            "files_downloaded": downloaded_files,
-            "count": len(downloaded_files)
-        }
+    # List downloaded files (os.walk reuses readdir file types instead of a stat() per entry)
+    downloaded_files = [
+        os.path.relpath(os.path.join(root, f), local_dir)
+        for root, _, files in os.walk(local_dir)
+        for f in files
+    ]
 
-    except Exception as e:
-        logger.error(f"✗ download_artifacts failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": run_id,
-            "local_dir": local_dir,
-            "traceback": traceback.format_exc()
-        }
+    logger.info("✓ Downloaded %s artifacts", len(downloaded_files))
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "local_dir": str(local_dir),
+        "files_downloaded": downloaded_files,
+        "count": len(downloaded_files)
+    }
 
 
 # ============================================================================
@@ -483,6 +557,7 @@ async def download_artifacts(
 # ============================================================================
 
 @mcp.tool()
+@_tool_errorwrap("run_id")
 async def delete_run(run_id: str) -> Dict[str, Any]:
     """
     Delete a run from MLflow
@@ -493,25 +568,64 @@ async def delete_run(run_id: str) -> Dict[str, Any]:
     Returns:
         Status of deletion
     """
-    logger.info(f"delete_run called: run_id={run_id}")
+    logger.info("delete_run called: run_id=%s", run_id)
+
+    if not _RUN_ID_RE.fullmatch(run_id):
+        logger.warning("delete_run rejected malformed run_id: %s", run_id)
+        return {"status": "error", "error": "invalid run_id", "error_type": "ValueError", "run_id": run_id}
+
+    await asyncio.to_thread(mlflow_client.delete_run, run_id)
+    _run_cache.pop(run_id, None)
+    logger.info("✓ Deleted run: %s", run_id)
+    return {
+        "status": "success",
+        "run_id": run_id,
+        "message": f"Run {run_id} deleted"
+    }
 
-    try:
-        mlflow_client.delete_run(run_id)
-        logger.info(f"✓ Deleted run: {run_id}")
-        return {
-            "status": "success",
-            "run_id": run_id,
-            "message": f"Run {run_id} deleted"
-        }
-    except Exception as e:
-        logger.error(f"✗ delete_run failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "run_id": run_id,
-            "traceback": traceback.format_exc()
-        }
+
+# Caps concurrent deletions so a large batch does not exhaust the tracking store's connection pool
+_delete_semaphore = asyncio.Semaphore(16)
+
+
+async def _delete_one(run_id: str) -> None:
+    if not _RUN_ID_RE.fullmatch(run_id):
+        raise ValueError("invalid run_id")
+    async with _delete_semaphore:
+        await asyncio.to_thread(mlflow_client.delete_run, run_id)
+    _run_cache.pop(run_id, None)
+
+
+@mcp.tool()
+async def delete_runs(run_ids: List[str]) -> Dict[str, Any]:
+    """
+    Delete several runs from MLflow concurrently
+
+    Args:
+        run_ids: List of run IDs to delete
+
+    Returns:
+        Succeeded run IDs and per-run errors for the ones that failed
+
+    Example:
+        delete_runs(run_ids=["4f6237ecab80420a9c6fc88e92a10493", "9b1e5c2d7a3f4e6b8c0d1a2b3c4d5e6f"])
+    """
+    logger.info("delete_runs called: %s runs", len(run_ids))
+
+    results = await asyncio.gather(*[_delete_one(run_id) for run_id in run_ids], return_exceptions=True)
+    succeeded = [run_id for run_id, r in zip(run_ids, results) if not isinstance(r, BaseException)]
+    failed = [
+        {"run_id": run_id, "error": str(r), "error_type": type(r).__name__}
+        for run_id, r in zip(run_ids, results) if isinstance(r, BaseException)
+    ]
+
+    logger.info("✓ delete_runs: %s deleted, %s failed", len(succeeded), len(failed))
+    return {
+        "status": "success" if not failed else ("partial" if succeeded else "error"),
+        "succeeded": succeeded,
+        "failed": failed,
+        "message": f"Deleted {len(succeeded)} of {len(run_ids)} runs"
+    }
 
 
 # ============================================================================
@@ -519,6 +633,7 @@ async def delete_run(run_id: str) -> Dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_tool_errorwrap()
 async def set_tracking_local(folder_out: str) -> Dict[str, Any]:
     """
     Set tracking to local folder
@@ -529,28 +644,44 @@ async def set_tracking_local(folder_out: str) -> Dict[str, Any]:
     Returns:
         Status
     """
-    logger.info(f"set_tracking_local called: folder_out={folder_out}")
+    logger.info("set_tracking_local called: folder_out=%s", folder_out)
+
+    await asyncio.to_thread(mlflow_client.set_tracking_local, folder_out)
+    _run_cache.clear()
+    logger.info("✓ Tracking set to local folder: %s", folder_out)
+    return {
+        "status": "success",
+        "tracking_uri": folder_out,
+        "type": "local",
+        "message": f"Tracking set to local folder: {folder_out}"
+    }
+
 
+# URI schemes MLflow can track to (the part before any +driver suffix)
+_TRACKING_DIALECTS = ("sqlite", "postgresql", "mysql", "mssql", "http", "https", "file", "databricks")
+
+
+def _redact_uri(uri: str) -> str:
+    """Rebuild a DB/tracking URI from dialect, host, port and database only; userinfo and query values are masked"""
+    if "://" not in uri:
+        return uri if uri in _TRACKING_DIALECTS else "***"
+    parts = urlsplit(uri)
+    netloc = parts.hostname or ""
     try:
-        mlflow_client.set_tracking_local(folder_out)
-        logger.info(f"✓ Tracking set to local folder: {folder_out}")
-        return {
-            "status": "success",
-            "tracking_uri": folder_out,
-            "type": "local",
-            "message": f"Tracking set to local folder: {folder_out}"
-        }
-    except Exception as e:
-        logger.error(f"✗ set_tracking_local failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc()
-        }
+        if parts.port is not None:
+            netloc = "%s:%s" % (netloc, parts.port)
+    except ValueError:
+        pass
+    if parts.username is not None or parts.password is not None:
+        netloc = "***@" + netloc
+    redacted = "%s://%s%s" % (parts.scheme, netloc, parts.path)
+    if parts.query:
+        redacted += "?" + "&".join("%s=***" % k for k, _ in parse_qsl(parts.query, keep_blank_values=True))
+    return redacted
 
 
 @mcp.tool()
+@_tool_errorwrap()
 async def set_tracking_remote(connection_string: str) -> Dict[str, Any]:
     """
     Set tracking to remote database
@@ -562,32 +693,78 @@ async def set_tracking_remote(connection_string: str) -> Dict[str, Any]:
     Returns:
         Status
     """
-    logger.info(f"set_tracking_remote called: connection_string={connection_string}")
-
-    try:
-        mlflow_client.set_tracking_remote(connection_string)
-        logger.info(f"✓ Tracking set to remote database")
-        return {
-            "status": "success",
-            "tracking_uri": connection_string,
-            "type": "remote",
-            "message": "Tracking set to remote database"
-        }
-    except Exception as e:
-        logger.error(f"✗ set_tracking_remote failed: {str(e)}", exc_info=True)
+    redacted = _redact_uri(connection_string)
+    logger.info("set_tracking_remote called: connection_string=%s", redacted)
+
+    # a bare "databricks" is MLflow's URI for the default Databricks profile; everything else needs <dialect>://
+    if connection_string == "databricks":
+        dialect = "databricks"
+    else:
+        dialect = connection_string.split("://", 1)[0].split("+", 1)[0].lower() if "://" in connection_string else None
+    if dialect not in _TRACKING_DIALECTS:
+        logger.warning("set_tracking_remote rejected connection_string: %s", redacted)
         return {
             "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc()
+            "error": "invalid connection_string, expected 'databricks' or <dialect>[+<driver>]://... with dialect one of %s" % ", ".join(_TRACKING_DIALECTS),
+            "error_type": "ValueError",
+            "tracking_uri": redacted
         }
 
+    await asyncio.to_thread(mlflow_client.set_tracking_remote, connection_string)
+    _run_cache.clear()
+    logger.info("✓ Tracking set to remote database")
+    return {
+        "status": "success",
+        "tracking_uri": redacted,
+        "type": "remote",
+        "message": "Tracking set to remote database"
+    }
+
 
 # ============================================================================
 # INFO: GET CURRENT STATE
 # ============================================================================
 
+# Burst polling collapses onto one backend probe: values are reused for `ttl` seconds and concurrent
+# callers wait on the same refresh. `failures`/`probe_ts` count consecutive failed probes of that cache, once per
+# fresh probe (not per cached read)
+_health_cache = {"ts": 0.0, "val": None, "lock": asyncio.Lock(), "failures": 0, "probe_ts": 0.0}
+_deep_health_cache = {"ts": 0.0, "val": None, "lock": asyncio.Lock(), "failures": 0, "probe_ts": 0.0}
+
+
+async def _cached_probe(cache: Dict[str, Any], ttl: float, probe) -> Any:
+    if cache["val"] is not None and time.monotonic() - cache["ts"] < ttl:
+        return cache["val"]
+    async with cache["lock"]:
+        if cache["val"] is not None and time.monotonic() - cache["ts"] < ttl:
+            return cache["val"]
+        cache["val"] = await probe()
+        cache["ts"] = time.monotonic()
+        return cache["val"]
+
+
+def _next_poll_delay(cache: Dict[str, Any], is_available: bool) -> float:
+    if cache["ts"] != cache["probe_ts"]:
+        cache["probe_ts"] = cache["ts"]
+        cache["failures"] = 0 if is_available else cache["failures"] + 1
+    # exponential backoff while unhealthy, reset on success; +-20% jitter keeps pollers from synchronising
+    delay = min(cfg.health_max_interval, cfg.health_base_interval * 2 ** cache["failures"])
+    return delay * random.uniform(0.8, 1.2)
+
+
+async def _tcp_probe(timeout: float = 1.0) -> bool:
+    # Liveness only: can a TCP connection to the tracking server be opened? No HTTP request, no backend work
+    host = urlsplit(cfg.host_mlflow).hostname or cfg.host_mlflow
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, cfg.port_mlflow), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
 @mcp.tool()
+@_tool_errorwrap()
 async def get_uris() -> Dict[str, Any]:
     """
     Get current MLflow URIs and configuration
@@ -597,74 +774,74 @@ async def get_uris() -> Dict[str, Any]:
     """
     logger.info("get_uris called")
 
-    try:
-        artifact_uri = mlflow_client.get_uris()
-        logger.info(f"✓ Retrieved URIs")
-        return {
-            "status": "success",
-            "artifact_uri": artifact_uri,
-            "mlflow_host": cfg.host_mlflow,
-            "mlflow_port": cfg.port_mlflow,
-            "message": "Current MLflow configuration"
-        }
-    except Exception as e:
-        logger.error(f"✗ get_uris failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc()
-        }
+    # Not cached: the artifact URI belongs to the active run, which save_experiment/update_run end.
+    # mlflow.get_artifact_uri() starts a run through the fluent API, so it shares the save/update lock
+    async with _fluent_lock:
+        artifact_uri = await asyncio.to_thread(mlflow_client.get_uris)
+    logger.info("✓ Retrieved URIs")
+    return {
+        "status": "success",
+        "artifact_uri": artifact_uri,
+        "mlflow_host": cfg.host_mlflow,
+        "mlflow_port": cfg.port_mlflow,
+        "message": "Current MLflow configuration"
+    }
 
 
 @mcp.tool()
-async def health_check() -> Dict[str, Any]:
+@_tool_errorwrap()
+async def health_check(poll_hint: bool = True, deep: bool = False) -> Dict[str, Any]:
     """
-    Check if MLflow server is available
+    Check if MLflow server is available (live probe, cached for cfg.health_ttl_s seconds)
+
+    Args:
+        deep: False (default) only checks that the server accepts TCP connections;
+              True issues an HTTP request to the MLflow server
+        poll_hint: Include next_poll_ms, a suggested delay before the next health_check
+                   (backs off exponentially with jitter while unhealthy)
 
     Returns:
         Server status
     """
     logger.info("health_check called")
 
-    try:
-        is_available = mlflow_client.is_available
-        status = "healthy" if is_available else "unhealthy"
-        logger.info(f"✓ health_check: {status}")
-        return {
-            "status": status,
-            "mlflow_available": is_available,
-            "host": cfg.host_mlflow,
-            "port": cfg.port_mlflow
-        }
-    except Exception as e:
-        logger.error(f"✗ health_check failed: {str(e)}", exc_info=True)
-        return {
-            "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc()
-        }
+    if deep:
+        cache = _deep_health_cache
+        probe = lambda: asyncio.to_thread(mlflow_client.ping)
+    else:
+        cache = _health_cache
+        probe = _tcp_probe
+    is_available = await _cached_probe(cache, cfg.health_ttl_s, probe)
+    status = "healthy" if is_available else "unhealthy"
+    logger.info("✓ health_check: %s", status)
+    result = {
+        "status": status,
+        "mlflow_available": is_available,
+        "host": cfg.host_mlflow,
+        "port": cfg.port_mlflow,
+        "probe": "http" if deep else "tcp"
+    }
+    if poll_hint:
+        result["next_poll_ms"] = int(_next_poll_delay(cache, is_available) * 1000)
+        result["consecutive_failures"] = cache["failures"]
+    return result
 
 
 # ============================================================================
 # MAIN ENTRY POINTS
 # ============================================================================
 
-if __name__ == "__main__":
-    logger.info(f"Starting MLflow MCP Server")
-    logger.info(f"  Host: {cfg.host_mlflow}")
-    logger.info(f"  Port: {cfg.port_mlflow}")
-    logger.info(f"  Status: {'Available' if mlflow_client.is_available else 'Unavailable'}")
-    logger.info(f"  Log file: mlflow_server.log")
-    mcp.run()
+def _log_startup():
+    logger.info("Starting MLflow MCP Server host=%s port=%s", cfg.host_mlflow, cfg.port_mlflow)
+    logger.info("Log file: mlflow_server.log")
 
 
 def main():
     """Entry point for console script"""
-    logger.info(f"Starting MLflow MCP Server (main)")
-    logger.info(f"  Host: {cfg.host_mlflow}")
-    logger.info(f"  Port: {cfg.port_mlflow}")
-    logger.info(f"  Status: {'Available' if mlflow_client.is_available else 'Unavailable'}")
-    logger.info(f"  Log file: mlflow_server.log")
-    mcp.run()
\ No newline at end of file
+    _log_startup()
+    mcp.run()
+
+
+if __name__ == "__main__":
+    _log_startup()
+    mcp.run()
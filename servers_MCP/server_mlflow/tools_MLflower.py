@@ -1,13 +1,70 @@
+import functools
 import os
+import socket
+import subprocess
+import time
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import mlflow
+from mlflow.entities import Metric, Param, RunTag
 from mlflow.tracking import MlflowClient
 # ----------------------------------------------------------------------------------------------------------------------
+class KeepAliveAdapter(HTTPAdapter):
+    # TCP keepalive on pooled sockets: idle connections silently dropped by a load balancer are detected in ~60s
+    # instead of stalling the next call until the OS TCP timeout. Tuned via MLFLOW_HTTP_TCP_KEEPALIVE{,_IDLE,_INTERVAL,_COUNT}
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + self.keepalive_socket_options()
+        super().init_poolmanager(*args, **kwargs)
+    # ---------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def keepalive_socket_options():
+        if os.environ.get('MLFLOW_HTTP_TCP_KEEPALIVE', 'true').lower() in ('0', 'false', 'no'):
+            return []
+
+        options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        for name, env, default in (('TCP_KEEPIDLE', 'MLFLOW_HTTP_TCP_KEEPALIVE_IDLE', 60),
+                                   ('TCP_KEEPINTVL', 'MLFLOW_HTTP_TCP_KEEPALIVE_INTERVAL', 20),
+                                   ('TCP_KEEPCNT', 'MLFLOW_HTTP_TCP_KEEPALIVE_COUNT', 3)):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), int(os.environ.get(env, default))))
+        return options
+# ----------------------------------------------------------------------------------------------------------------------
+def install_mlflow_keepalive():
+    # MLflow's REST store (log_*, get_run, search_runs, delete_run, ...) does not use MLFlower.session but its own cached
+    # sessions from mlflow.utils.request_utils; give the connection pools of every session it hands out the same options
+    from mlflow.utils import request_utils
+    cached_get_session = getattr(request_utils, '_cached_get_request_session', None)
+    if cached_get_session is None or getattr(cached_get_session, 'keepalive_installed', False):
+        return
+
+    socket_options = HTTPConnection.default_socket_options + KeepAliveAdapter.keepalive_socket_options()
+
+    @functools.wraps(cached_get_session)
+    def get_session(*args, **kwargs):
+        session = cached_get_session(*args, **kwargs)
+        for adapter in session.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                adapter.poolmanager.connection_pool_kw['socket_options'] = socket_options
+        return session
+
+    get_session.cache_clear = cached_get_session.cache_clear
+    get_session.cache_info = cached_get_session.cache_info
+    get_session.keepalive_installed = True
+    request_utils._cached_get_request_session = get_session
+    return
+# ----------------------------------------------------------------------------------------------------------------------
 class MLFlower(object):
     def __init__(self,host,port,username_mlflow=None,password_mlflow=None,remote_storage_folder=None,username_ssh=None,ppk_key_path=None,password_ssh=None):
 
+        self.session = self.create_session()
+        self.probe_session = self.create_session(max_retries=0)
+        self.clients = {}
+        install_mlflow_keepalive()
+
         if not self.check_is_available(host,port,username_mlflow,password_mlflow):
             self.is_available = False
             return
@@ -33,6 +90,7 @@ class MLFlower(object):
 
         self.remote_host = host
         self.remote_port = port
+        self.auth = HTTPBasicAuth(username_mlflow, password_mlflow) if username_mlflow is not None and password_mlflow is not None else None
 
         self.username_ssh = username_ssh
         self.ppk_key_path = ppk_key_path
@@ -40,6 +98,24 @@ class MLFlower(object):
         self.remote_storage_folder = remote_storage_folder
         return
 # ---------------------------------------------------------------------------------------------------------------------
+    def create_session(self,max_retries=None):
+        # pooled keep-alive connections with retry/backoff and TCP keepalive, reused for every HTTP probe of the tracking server
+        if max_retries is None:
+            max_retries = Retry(total=3, backoff_factor=0.3)
+        session = requests.Session()
+        adapter = KeepAliveAdapter(pool_connections=10, pool_maxsize=50, max_retries=max_retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    # ---------------------------------------------------------------------------------------------------------------------
+    def get_client(self):
+        # one MlflowClient per tracking URI, so its store (REST session or SQLAlchemy engine) is built once and reused
+        tracking_uri = mlflow.get_tracking_uri()
+        client = self.clients.get(tracking_uri)
+        if client is None:
+            client = self.clients[tracking_uri] = MlflowClient(tracking_uri)
+        return client
+    # ---------------------------------------------------------------------------------------------------------------------
     def construct_host_ssh(self,host):
         host_ssh = host
         if host_ssh.startswith('http://'):host_ssh = host_ssh[7:]
@@ -53,7 +129,7 @@ class MLFlower(object):
 
         try:
             auth = HTTPBasicAuth(username, password) if username is not None and password is not None else None
-            response = requests.get(f'{host}:{port}', auth=auth, timeout=5)
+            response = self.probe_session.get(f'{host}:{port}', auth=auth, timeout=5)
             if response.status_code == 200:
                 result = True
             else:
@@ -67,15 +143,28 @@ class MLFlower(object):
 
         return result
     # ---------------------------------------------------------------------------------------------------------------------
+    def ping(self,timeout=5):
+        # live, silent liveness probe of the tracking server; no retries, so a dead host fails within one timeout
+        try:
+            return self.probe_session.get(f'{self.remote_host}:{self.remote_port}', auth=self.auth, timeout=timeout).status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+    # ---------------------------------------------------------------------------------------------------------------------
+    def run_command(self,command):
+        # argv list, no shell: one fork+exec instead of /bin/sh + command, and no quoting issues with passwords or paths
+        try:
+            return subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL).returncode
+        except OSError:
+            return -1
+    # ---------------------------------------------------------------------------------------------------------------------
     def check_ssh(self,host_ssh,username,password):
 
         if password is None:
             return False
 
 
-        command = 'sshpass -p %s ssh -o StrictHostKeyChecking=no -p %d %s@%s exit'%(password,int(22),username,host_ssh)
-        response = os.system(command)
-        result = (response == 0)
+        command = ['sshpass', '-p', password, 'ssh', '-o', 'StrictHostKeyChecking=no', '-p', str(22), f'{username}@{host_ssh}', 'exit']
+        result = (self.run_command(command) == 0)
 
         if result is False:
             print(f'SSH unavailable: {username}@{host_ssh}')
@@ -86,12 +175,13 @@ class MLFlower(object):
         filename_only = local_file_path.split('/')[-1]
 
         if self.ppk_key_path is not None:
-            command = f'scp -o StrictHostKeyChecking=no -P {int(22)} -i {self.ppk_key_path} {local_file_path} {self.username_ssh}@{self.host_ssh}:{remote_folder}{filename_only}'
+            command = ['scp', '-o', 'StrictHostKeyChecking=no', '-P', str(22), '-i', self.ppk_key_path, local_file_path, f'{self.username_ssh}@{self.host_ssh}:{remote_folder}{filename_only}']
+            self.run_command(command)
         elif self.password_ssh is not None:
-            command = f'sshpass -p {self.password_ssh} ssh -o StrictHostKeyChecking=no -p {int(22)} {self.username_ssh}@{self.host_ssh} mkdir -p {remote_folder}'
-            os.system(command)
-            command  = f'sshpass -p {self.password_ssh} scp -o StrictHostKeyChecking=no {local_file_path} {self.username_ssh}@{self.host_ssh}:{remote_folder}{filename_only}'
-            os.system(command)
+            command = ['sshpass', '-p', self.password_ssh, 'ssh', '-o', 'StrictHostKeyChecking=no', '-p', str(22), f'{self.username_ssh}@{self.host_ssh}', 'mkdir', '-p', remote_folder]
+            self.run_command(command)
+            command = ['sshpass', '-p', self.password_ssh, 'scp', '-o', 'StrictHostKeyChecking=no', local_file_path, f'{self.username_ssh}@{self.host_ssh}:{remote_folder}{filename_only}']
+            self.run_command(command)
 
         return
     # ---------------------------------------------------------------------------------------------------------------------
@@ -111,7 +201,7 @@ class MLFlower(object):
             if experiment is None:
                 return None
 
-            client = MlflowClient()
+            client = self.get_client()
             runs = client.search_runs(experiment_ids=[experiment.experiment_id],order_by=["attribute.start_time DESC"],max_results=1)
 
             if runs:
@@ -121,26 +211,35 @@ class MLFlower(object):
             print(f"Error getting last run_id: {e}")
             return None
     # ---------------------------------------------------------------------------------------------------------------------
+    def get_run(self,run_id):
+        return self.get_client().get_run(run_id)
+    # ---------------------------------------------------------------------------------------------------------------------
     def get_run_params(self,run_id):
-        return mlflow.get_run(run_id).data.params
+        return self.get_client().get_run(run_id).data.params
     # ---------------------------------------------------------------------------------------------------------------------
     def get_run_metrics(self,run_id):
-        return mlflow.get_run(run_id).data.metrics
+        return self.get_client().get_run(run_id).data.metrics
     # ---------------------------------------------------------------------------------------------------------------------
-    def get_run_artifact_filenames(self,run_id):
-        client = MlflowClient()
-        artifact_uri = client.get_run(run_id).info.artifact_uri
+    def get_run_artifact_filenames(self,run_id,artifact_uri=None):
+        client = self.get_client()
+        if artifact_uri is None:
+            artifact_uri = client.get_run(run_id).info.artifact_uri
         artifacts = client.list_artifacts(run_id)
         filenames = [artifact_uri + artifact.path for artifact in artifacts]
         return filenames
     # ---------------------------------------------------------------------------------------------------------------------
+    def download_single(self,artifact_path,run_id,local_dir):
+        client = self.get_client()
+        client.download_artifacts(run_id, artifact_path, local_dir)
+        return
+    # ---------------------------------------------------------------------------------------------------------------------
     def download_artifacts(self,local_dir,run_id):
-        client = MlflowClient()
-        client.download_artifacts(run_id, "", local_dir)
+        # one call for the whole tree: MLflow's artifact repository already downloads the files on its own thread pool
+        self.download_single("", run_id, local_dir)
         return
     # ---------------------------------------------------------------------------------------------------------------------
     def delete_run(self,run_id):
-        mlflow.delete_run(run_id)
+        self.get_client().delete_run(run_id)
         return
     # ---------------------------------------------------------------------------------------------------------------------
     def update_run(self,run_id,metrics={},artifacts=[]):
@@ -156,6 +255,22 @@ class MLFlower(object):
             mlflow.end_run()
         return
     # ---------------------------------------------------------------------------------------------------------------------
+    def log_batch(self,run_id,metrics=None,params=None,tags=None,step=0):
+        # one log_batch request holds at most 1000 metrics, 100 params and 100 tags (1000 entries in total)
+        timestamp = int(time.time() * 1000)
+        metrics = [Metric(k, float(v), timestamp, step) for k, v in (metrics or {}).items()]
+        params = [Param(k, str(v)) for k, v in (params or {}).items()]
+        tags = [RunTag(k, str(v)) for k, v in (tags or {}).items()]
+
+        client = self.get_client()
+        while metrics or params or tags:
+            batch_params, params = params[:100], params[100:]
+            batch_tags, tags = tags[:100], tags[100:]
+            n_metrics = 1000 - len(batch_params) - len(batch_tags)
+            batch_metrics, metrics = metrics[:n_metrics], metrics[n_metrics:]
+            client.log_batch(run_id, metrics=batch_metrics, params=batch_params, tags=batch_tags)
+        return
+    # ---------------------------------------------------------------------------------------------------------------------
     def set_tracking_local(self,folder_out):
         #Runs are recorded locally
         mlflow.set_tracking_uri(folder_out)
@@ -164,6 +279,9 @@ class MLFlower(object):
     # ---------------------------------------------------------------------------------------------------------------------
     def set_tracking_remote(self,connection_string):
         # Runs are recorded remotely, Database is encoded as <dialect>+<driver>://<username>:<password>@<host>:<port>/<database>
+        # SQLAlchemy store pool sizing, read by MLflow when the engine is created (pool_pre_ping is always on)
+        os.environ.setdefault('MLFLOW_SQLALCHEMYSTORE_POOL_SIZE', '10')
+        os.environ.setdefault('MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW', '20')
         mlflow.set_tracking_uri(connection_string)
         return
     # ---------------------------------------------------------------------------------------------------------------------
@@ -174,7 +292,11 @@ class MLFlower(object):
         print('registry_uri:',mlflow.get_registry_uri())
         print('tracking_uri:',mlflow.get_tracking_uri())
 
+        # get_artifact_uri() implicitly starts a run when none is active; end it here so it is not left open on this thread
+        had_active_run = mlflow.active_run() is not None
         artifact_uri = mlflow.get_artifact_uri()
+        if not had_active_run:
+            mlflow.end_run()
         print('artifact_uri:',artifact_uri)
 
         return artifact_uri